@@ -0,0 +1,14 @@
+# gunicorn -c gunicorn.conf.py main:app
+#
+# One worker: the bot keeps its monitors and config in process memory, so a
+# second worker would open a second Deriv socket and double every alert.
+# Webhooks are served concurrently by the worker's thread pool.
+bind = "0.0.0.0:8080"
+workers = 1
+worker_class = "gthread"
+threads = 8
+
+def post_fork(server, worker):
+    # Start the hub and background threads in the worker, not the master
+    import main
+    main.start_bot()
@@ -1,6 +1,8 @@
-import json, threading, time, requests, numpy as np
+import asyncio, atexit, itertools, logging, os, queue, re, threading, time, requests, orjson, numpy as np
 from flask import Flask, request
-import websocket
+from requests.adapters import HTTPAdapter
+import websockets
+from utils import TIE_EPS, make_checker, rolling_mean_cumsum
 
 # === Load and save config ===
 
@@ -8,152 +10,488 @@ CONFIG_FILE = "config.json"
 
 def load_config():
     try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(CONFIG_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return {"bot_token": "", "chat_id": "", "symbols": []}
 
+# Mutations only mark the config pending; config_saver writes at most once per
+# SAVE_INTERVAL. In-memory state is authoritative for the running session.
+SAVE_INTERVAL = 1.0
+_pending_config = None
+_last_serialized = None
+
+def write_config(config):
+    global _last_serialized
+    data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    if data == _last_serialized:
+        return
+    # Write then rename, so config.json is never left half-written
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, CONFIG_FILE)
+    _last_serialized = data
+
 def save_config(config):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    global _pending_config
+    _pending_config = config
+
+def flush_config():
+    global _pending_config
+    pending, _pending_config = _pending_config, None
+    if pending is None:
+        return
+    try:
+        write_config(pending)
+    except OSError as e:
+        print("Config save error:", e)
+        _pending_config = pending
+
+def config_saver():
+    while True:
+        time.sleep(SAVE_INTERVAL)
+        flush_config()
+
+def start_config_saver():
+    threading.Thread(target=config_saver, daemon=True).start()
+    atexit.register(flush_config)
+
+# Lookup mirrors of config["symbols"]: name -> sym dict, (name, granularity) -> tf dict
+_symbol_index = {}
+_tf_index = {}
+
+def index_config(config):
+    _symbol_index.clear()
+    _tf_index.clear()
+    for sym in config.get("symbols", []):
+        _symbol_index[sym["name"]] = sym
+        for tf in sym.get("timeframes", []):
+            _tf_index[(sym["name"], tf["granularity"])] = tf
 
 config = load_config()
+index_config(config)
 
 bot_token = config.get("bot_token")
 chat_id = config.get("chat_id")
 symbols = config.get("symbols", [])  # List of dicts: {name, timeframes: [{fast_ma, slow_ma, granularity}]}
+bypass_parsing = config.get("bypass_parsing", True)  # Read only the latest candle from raw WS text
 
 # === Telegram send message ===
-def send_telegram(text):
+# Keep-alive session so repeated sends reuse one TLS connection to api.telegram.org
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Telegram messages and events.log lines share one queue and one consumer
+# thread, so neither the WS loop nor the webhook ever waits on I/O.
+OUTPUT_Q = queue.SimpleQueue()  # (sink, text), sink is "telegram" or "log"
+BATCH_WINDOW = 0.5  # Seconds to coalesce queued messages into one POST
+TELEGRAM_MAX_LEN = 4096
+
+def post_telegram(text):
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
     data = {"chat_id": chat_id, "text": text}
     try:
-        requests.post(url, data=data)
+        SESSION.post(url, data=data, timeout=5)
     except Exception as e:
         print("Telegram send error:", e)
 
+def post_telegram_batch(messages):
+    # Join the batch, splitting only where a message would exceed Telegram's limit
+    text = messages[0]
+    for line in messages[1:]:
+        if len(text) + 1 + len(line) > TELEGRAM_MAX_LEN:
+            post_telegram(text)
+            text = line
+        else:
+            text += "\n" + line
+    post_telegram(text)
+
+def send_telegram(text):
+    OUTPUT_Q.put(("telegram", text))
+
 # === Logging crossovers ===
-def log_event(text):
-    with open("events.log", "a") as f:
-        f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - {text}\n")
+LOG_FILE = "events.log"
+LOG_FLUSH_INTERVAL = 2.0
+_LOG_FH = open(LOG_FILE, "ab", buffering=1 << 16)
 
-# === Crossover check ===
-def check_crossover(data):
-    closes = data["closes"]
-    fast = data["fast_ma"]
-    slow = data["slow_ma"]
+def log_event(text):
+    OUTPUT_Q.put(("log", f"{time.strftime('%Y-%m-%d %H:%M:%S')} - {text}\n"))
 
-    if len(closes) < slow + 2:
-        return
+def write_event_log(line):
+    # A failing log must not take down the consumer that also sends Telegram
+    try:
+        _LOG_FH.write(line.encode())
+    except OSError as e:
+        print("Event log error:", e)
 
-    fast_now = np.mean(closes[-fast:])
-    slow_now = np.mean(closes[-slow:])
-    fast_prev = np.mean(closes[-fast - 1:-1])
-    slow_prev = np.mean(closes[-slow - 1:-1])
+def flush_event_log():
+    # At exit: write out log lines still queued; unsent Telegram messages are dropped
+    while True:
+        try:
+            sink, text = OUTPUT_Q.get_nowait()
+        except queue.Empty:
+            break
+        if sink == "log":
+            write_event_log(text)
+    try:
+        _LOG_FH.flush()
+    except OSError as e:
+        print("Event log error:", e)
 
-    sym = data["name"]
-    tf = int(data["granularity"]) // 60
+atexit.register(flush_event_log)
 
-    if fast_prev < slow_prev and fast_now > slow_now:
-        msg = f"[{sym} {tf}m] Bullish MA crossover!"
-        send_telegram(msg)
-        log_event(msg)
-    elif fast_prev > slow_prev and fast_now < slow_now:
-        msg = f"[{sym} {tf}m] Bearish MA crossover!"
-        send_telegram(msg)
-        log_event(msg)
+def drain_output(last_flush):
+    # One pass of the consumer: wait for a batch, write its log lines, post its
+    # Telegram messages together, and flush the log if it is due. Returns the
+    # time of the last flush.
+    try:
+        batch = [OUTPUT_Q.get(timeout=LOG_FLUSH_INTERVAL)]
+    except queue.Empty:
+        batch = []
+    deadline = time.monotonic() + BATCH_WINDOW
+    while batch and (remaining := deadline - time.monotonic()) > 0:
+        try:
+            batch.append(OUTPUT_Q.get(timeout=remaining))
+        except queue.Empty:
+            break
+
+    messages = []
+    for sink, text in batch:
+        if sink == "log":
+            write_event_log(text)
+        else:
+            messages.append(text)
+    if messages:
+        post_telegram_batch(messages)
+    if time.monotonic() - last_flush >= LOG_FLUSH_INTERVAL:
+        try:
+            _LOG_FH.flush()
+        except OSError as e:
+            print("Event log error:", e)
+        last_flush = time.monotonic()
+    return last_flush
+
+def output_sender():
+    last_flush = time.monotonic()
+    while True:
+        last_flush = drain_output(last_flush)
+
+def start_output_sender():
+    threading.Thread(target=output_sender, daemon=True).start()
+
+# === Raw candle field patterns for the bypass-parsing path ===
+CLOSE_RE = re.compile(r'"close":\s*"?([0-9.eE+-]+)')
+EPOCH_RE = re.compile(r'"epoch":\s*(\d+)')
+
+def latest_candle(message):
+    # Only single-candle "candles" payloads qualify, the same messages the full
+    # decode reads. With several candles, the older ones may carry a final close
+    # the ring still needs, so those take the full decode too.
+    if '"candles":' not in message:
+        return None
+    i = message.rfind('"close":')
+    j = message.rfind('"epoch":')
+    if i < 0 or j < 0 or message.find('"close":') != i:
+        return None
+    close = CLOSE_RE.match(message, i)
+    epoch = EPOCH_RE.match(message, j)
+    if not close or not epoch:
+        return None
+    return int(epoch.group(1)), float(close.group(1))
+
+# === Candle state for all monitors as parallel arrays, one row per slot ===
+class MonitorTable:
+    def __init__(self, capacity=16, width=64):
+        self.fast_sum = np.zeros(capacity, dtype=np.float64)
+        self.slow_sum = np.zeros(capacity, dtype=np.float64)
+        self.head = np.zeros(capacity, dtype=np.int64)  # Ring slot the next close goes into
+        self.count = np.zeros(capacity, dtype=np.int64)
+        # A row uses its monitor's first window columns as a circular buffer
+        self.closes_ring = np.zeros((capacity, width), dtype=np.float64)
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def _grow(self, capacity, width):
+        rows, cols = self.closes_ring.shape
+        for field in ("fast_sum", "slow_sum", "head", "count"):
+            old = getattr(self, field)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:rows] = old
+            setattr(self, field, new)
+        ring = np.zeros((capacity, width), dtype=np.float64)
+        ring[:rows, :cols] = self.closes_ring
+        self.closes_ring = ring
+        self.free.extend(range(capacity - 1, rows - 1, -1))
+
+    def alloc(self, window):
+        rows, cols = self.closes_ring.shape
+        if not self.free or window > cols:
+            self._grow(rows * 2 if not self.free else rows, max(cols, window))
+        idx = self.free.pop()
+        self.fast_sum[idx] = self.slow_sum[idx] = 0.0
+        self.head[idx] = self.count[idx] = 0
+        return idx
+
+    def release(self, idx):
+        self.free.append(idx)
+
+    def update(self, check, idx, close, replace):
+        # 1 for a bullish crossover on the newest close, -1 bearish, 0 none
+        return check(idx, close, replace, self.closes_ring, self.head, self.count,
+                     self.fast_sum, self.slow_sum)
+
+table = MonitorTable()
+
+# === Candle state per symbol/timeframe ===
+REQ_IDS = itertools.count(1)
 
-# === Manage WebSocket per symbol/timeframe ===
 class Monitor:
     def __init__(self, name, fast_ma, slow_ma, granularity):
         self.name = name
         self.fast_ma = fast_ma
         self.slow_ma = slow_ma
         self.granularity = granularity
-        self.closes = []
-        self.ws = None
-        self.thread = threading.Thread(target=self.run)
-        self.thread.daemon = True
-        self.active = True
+        self.idx = None  # Row in the state table, assigned by the hub
+        self.window = max(fast_ma, slow_ma) + 2  # Ring size; see make_checker
+        self._check = make_checker(fast_ma, slow_ma)
+        self.last_epoch = None
+        self.req_id = next(REQ_IDS)
+        # The subscribe request never changes, so it is encoded once here
+        self.subscribe_payload = orjson.dumps({
+            "candles": name,
+            "subscribe": 1,
+            "style": "candles",
+            "granularity": granularity,
+            "req_id": self.req_id
+        }).decode()
+        self.subscription_id = None
 
-    def on_message(self, ws, message):
+    def on_message(self, message):
         try:
-            msg = json.loads(message)
+            # Once seeded and subscribed, a payload whose newest candle is
+            # the current or the next one only needs that close. Anything
+            # else (first snapshot, a gap, errors) takes the full decode below.
+            if bypass_parsing and self.last_epoch is not None and self.subscription_id:
+                latest = latest_candle(message)
+                if latest and self.last_epoch <= latest[0] <= self.last_epoch + self.granularity:
+                    self.notify_crossover(self.apply_close(*latest))
+                    return
+
+            msg = orjson.loads(message)
+            subscription = msg.get("subscription")
+            if subscription:
+                self.subscription_id = subscription.get("id")
             candles = msg.get("candles")
             if candles:
-                closes = [float(c["close"]) for c in candles]
-                self.closes = closes
-                check_crossover({
-                    "name": self.name,
-                    "fast_ma": self.fast_ma,
-                    "slow_ma": self.slow_ma,
-                    "granularity": self.granularity,
-                    "closes": self.closes
-                })
+                if self.last_epoch is None:
+                    self._backfill_crossovers(
+                        np.fromiter((float(c["close"]) for c in candles), dtype=np.float64, count=len(candles)),
+                        [c["epoch"] for c in candles]
+                    )
+                # Only the last window closes can reach the ring buffer, and
+                # only the newest is checked, as the history was backfilled
+                for c in candles[-self.window:]:
+                    direction = self.apply_close(c["epoch"], float(c["close"]))
+                self.notify_crossover(direction)
         except Exception as e:
             print(f"[{self.name} {int(self.granularity)//60}m] Message error: {e}")
 
-    def on_open(self, ws):
-        req = {
-            "candles": self.name,
-            "subscribe": 1,
-            "style": "candles",
-            "granularity": self.granularity
-        }
-        ws.send(json.dumps(req))
+    def apply_close(self, epoch, close):
+        if self.last_epoch is not None and epoch < self.last_epoch:
+            return 0
+        replace = epoch == self.last_epoch
+        self.last_epoch = epoch
+        return table.update(self._check, self.idx, close, replace)
+
+    def _backfill_crossovers(self, closes_np, epochs):
+        # Scan the initial history snapshot for crossovers in one vectorized
+        # pass. The final step is left to the live per-tick check.
+        fast = self.fast_ma
+        slow = self.slow_ma
+        longest = max(fast, slow)
+        if min(fast, slow) < 1 or len(closes_np) < longest + 2:
+            return
+
+        # Align both series on the candles where the longer window is full
+        n = len(closes_np) - longest + 1
+        slow_ma = rolling_mean_cumsum(closes_np, slow)[-n:]
+        fast_ma = rolling_mean_cumsum(closes_np, fast)[-n:]
+        # As in the live check, differences within rounding noise are ties
+        diff = fast_ma - slow_ma
+        diff[np.abs(diff) <= TIE_EPS * (np.abs(fast_ma) + np.abs(slow_ma))] = 0.0
+        # Like the live check, the first step counts only once longest + 2 closes
+        # exist, so the first aligned point is dropped along with the live tail
+        sign = np.sign(diff)[1:-1]
+        step = np.diff(sign)
+        bullish = np.nonzero(step == 2)[0]
+        bearish = np.nonzero(step == -2)[0]
+        if len(bullish) == 0 and len(bearish) == 0:
+            return
+
+        # step[i] is the move onto candle i + longest + 1
+        last = np.concatenate((bullish, bearish)).max()
+        last_kind = "Bullish" if last in bullish else "Bearish"
+        last_time = time.strftime('%Y-%m-%d %H:%M', time.gmtime(epochs[last + longest + 1]))
+        tf = int(self.granularity) // 60
+        msg = (f"[{self.name} {tf}m] History: {len(bullish)} bullish, {len(bearish)} bearish "
+               f"MA crossovers. Last: {last_kind} at {last_time} UTC")
+        send_telegram(msg)
+        log_event(msg)
+
+    def notify_crossover(self, direction):
+        if direction == 0:
+            return
 
-    def on_close(self, ws, close_status_code, close_msg):
-        print(f"[{self.name} {int(self.granularity)//60}m] WebSocket closed")
+        tf = int(self.granularity) // 60
+        kind = "Bullish" if direction > 0 else "Bearish"
+        msg = f"[{self.name} {tf}m] {kind} MA crossover!"
+        send_telegram(msg)
+        log_event(msg)
 
-    def run(self):
+# === One WebSocket shared by every symbol/timeframe ===
+DERIV_WS_URL = "wss://ws.deriv.com/websockets/v3"
+REQ_ID_RE = re.compile(r'"req_id":\s*(\d+)')
+
+class WSHub:
+    def __init__(self, url):
+        self.url = url
+        self.routes = {}  # req_id -> Monitor
+        # req_ids removed before their subscription ack arrived; forgotten on ack
+        self.pending_forget = set()
+        self.ws = None  # Set while connected
+        # All WS I/O and every change to routes/table runs on this loop, in one
+        # thread, so the per-tick updates never race a slot allocation.
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.serve)
+        self.thread.daemon = True
+        self.active = True
+
+    def add(self, monitor):
+        self.loop.call_soon_threadsafe(self._add, monitor)
+
+    def remove(self, monitor):
+        self.loop.call_soon_threadsafe(self._remove, monitor)
+
+    def _add(self, monitor):
+        monitor.idx = table.alloc(monitor.window)
+        self.routes[monitor.req_id] = monitor
+        # Not connected: the subscription goes out with the rest on connect
+        if self.ws is not None:
+            self.loop.create_task(self.send(monitor.subscribe_payload))
+
+    def _remove(self, monitor):
+        if self.routes.pop(monitor.req_id, None) is None:
+            return
+        table.release(monitor.idx)
+        if self.ws is None:
+            return  # Subscriptions die with the socket
+        if monitor.subscription_id:
+            self.forget(monitor.subscription_id)
+        else:
+            self.pending_forget.add(monitor.req_id)
+
+    def forget(self, subscription_id):
+        self.loop.create_task(self.send(orjson.dumps({"forget": subscription_id}).decode()))
+
+    async def send(self, payload):
+        ws = self.ws
+        if ws is None:
+            return
+        try:
+            await ws.send(payload)
+        except websockets.ConnectionClosed:
+            pass  # Resubscribed on reconnect
+
+    def on_message(self, message):
+        # Deriv echoes req_id on every response, including streamed updates
+        i = message.rfind('"req_id":')
+        match = REQ_ID_RE.match(message, i) if i >= 0 else None
+        if not match:
+            return
+        req_id = int(match.group(1))
+        monitor = self.routes.get(req_id)
+        if monitor:
+            monitor.on_message(message)
+        elif req_id in self.pending_forget:
+            self.pending_forget.discard(req_id)
+            subscription = orjson.loads(message).get("subscription")
+            if subscription and subscription.get("id"):
+                self.forget(subscription["id"])
+
+    async def run(self):
         while self.active:
             try:
-                websocket.enableTrace(True)
-                self.ws = websocket.WebSocketApp(
-                    "wss://ws.deriv.com/websockets/v3",
-                    on_message=self.on_message,
-                    on_open=self.on_open,
-                    on_close=self.on_close
-                )
-                self.ws.run_forever()
+                async with websockets.connect(self.url) as ws:
+                    self.ws = ws
+                    self.pending_forget.clear()
+                    for m in list(self.routes.values()):
+                        m.subscription_id = None  # Re-read from the new snapshot
+                        await ws.send(m.subscribe_payload)
+                    async for message in ws:
+                        self.on_message(message)
+                print(f"[hub] WebSocket closed ({len(self.routes)} subscriptions)")
             except Exception as e:
-                print(f"[{self.name} {int(self.granularity)//60}m] WS error: {e}")
-            time.sleep(5)
+                print(f"[hub] WS error: {e}")
+            self.ws = None
+            await asyncio.sleep(5)
+
+    def serve(self):
+        self.loop.run_until_complete(self.run())
 
     def start(self):
-        self.thread.start()
+        if os.environ.get("WS_TRACE"):
+            logging.basicConfig()
+            logging.getLogger("websockets").setLevel(logging.DEBUG)
+        if not self.thread.is_alive():
+            self.thread.start()
 
     def stop(self):
         self.active = False
-        if self.ws:
-            self.ws.close()
+        ws = self.ws
+        if ws is not None:
+            asyncio.run_coroutine_threadsafe(ws.close(), self.loop)
+
+hub = WSHub(DERIV_WS_URL)
 
 # === Global monitors dictionary to manage all active monitors ===
 monitors = {}
 
 # === Start monitors from config ===
+def valid_ma_pair(fast_ma, slow_ma):
+    return fast_ma >= 1 and slow_ma >= 1
+
 def start_all_monitors():
     for sym in symbols or []:
         name = sym["name"]
         for tf in sym.get("timeframes", []):
             key = f"{name}_{tf['granularity']}"
+            if not valid_ma_pair(tf["fast_ma"], tf["slow_ma"]):
+                msg = f"[{name} {int(tf['granularity'])//60}m] Not monitored: MA periods must be at least 1"
+                print(msg)
+                send_telegram(msg)
+                continue
             if key not in monitors:
                 m = Monitor(name, tf["fast_ma"], tf["slow_ma"], tf["granularity"])
                 monitors[key] = m
-                m.start()
+                hub.add(m)
+    hub.start()
 
 # === Stop all monitors ===
 def stop_all_monitors():
     for m in monitors.values():
-        m.stop()
+        hub.remove(m)
     monitors.clear()
 
 # === Telegram webhook handler ===
 app = Flask('')
+commands_lock = threading.Lock()
 
 @app.route('/webhook', methods=['POST'])
 def telegram_webhook():
-    data = request.json
+    try:
+        data = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        data = None
     if not data or "message" not in data:
         return {"ok": True}
 
@@ -166,7 +504,11 @@ def telegram_webhook():
     if str(chat_id_msg) != str(chat_id):
         return {"ok": True}
 
-    # Handle commands
+    # gthread workers serve webhooks concurrently, and commands mutate the shared config
+    with commands_lock:
+        return handle_command(text)
+
+def handle_command(text):
     if text.startswith("/"):
         parts = text.split()
         cmd = parts[0].lower()
@@ -184,27 +526,33 @@ def telegram_webhook():
             except ValueError:
                 send_telegram("MA periods and granularity must be integers.")
                 return {"ok": True}
+            if not valid_ma_pair(fast_ma, slow_ma):
+                send_telegram("MA periods must be at least 1.")
+                return {"ok": True}
+            # Check if timeframe exists
+            if (sym_name, gran) in _tf_index:
+                send_telegram(f"{sym_name} already has timeframe {gran}s")
+                return {"ok": True}
             # Find symbol in config or add new
-            sym = next((s for s in symbols or [] if s["name"] == sym_name), None)
+            sym = _symbol_index.get(sym_name)
             if sym is None:
                 sym = {"name": sym_name, "timeframes": []}
                 symbols.append(sym)
-            # Check if timeframe exists
-            if any(tf["granularity"] == gran for tf in sym["timeframes"]):
-                send_telegram(f"{sym_name} already has timeframe {gran}s")
-                return {"ok": True}
-            sym["timeframes"].append({
+                _symbol_index[sym_name] = sym
+            tf = {
                 "fast_ma": fast_ma,
                 "slow_ma": slow_ma,
                 "granularity": gran
-            })
+            }
+            sym["timeframes"].append(tf)
+            _tf_index[(sym_name, gran)] = tf
             save_config(config)
             # Start monitor immediately
             key = f"{sym_name}_{gran}"
             if key not in monitors:
                 m = Monitor(sym_name, fast_ma, slow_ma, gran)
                 monitors[key] = m
-                m.start()
+                hub.add(m)
             send_telegram(f"Added {sym_name} {gran}s with fast MA={fast_ma} slow MA={slow_ma}")
             return {"ok": True}
 
@@ -219,15 +567,11 @@ def telegram_webhook():
             except ValueError:
                 send_telegram("Granularity must be integer seconds.")
                 return {"ok": True}
-            sym = next((s for s in symbols or [] if s["name"] == sym_name), None)
+            sym = _symbol_index.get(sym_name)
             if not sym:
                 send_telegram(f"No symbol {sym_name} found.")
                 return {"ok": True}
-            tf_to_remove = None
-            for tf in sym["timeframes"]:
-                if tf["granularity"] == gran:
-                    tf_to_remove = tf
-                    break
+            tf_to_remove = _tf_index.pop((sym_name, gran), None)
             if not tf_to_remove:
                 send_telegram(f"No timeframe {gran}s found for {sym_name}")
                 return {"ok": True}
@@ -235,12 +579,12 @@ def telegram_webhook():
             # Stop monitor if running
             key = f"{sym_name}_{gran}"
             if key in monitors:
-                monitors[key].stop()
-                del monitors[key]
+                hub.remove(monitors.pop(key))
 
             # If symbol has no timeframes left, remove symbol entirely
             if len(sym["timeframes"]) == 0:
                 symbols.remove(sym)
+                del _symbol_index[sym_name]
 
             save_config(config)
             send_telegram(f"Removed {sym_name} {gran}s monitor.")
@@ -283,6 +627,12 @@ def home():
     return "Monitoring: " + ", ".join(info)
 
 # === Start the bot ===
-if __name__ == "__main__":
+# Under gunicorn this is called from the post_fork hook in gunicorn.conf.py
+def start_bot():
+    start_config_saver()
+    start_output_sender()
     start_all_monitors()
+
+if __name__ == "__main__":
+    start_bot()
     app.run(host='0.0.0.0', port=8080)
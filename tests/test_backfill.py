@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+import main
+
+
+def reference_crossovers(closes, fast, slow):
+    # Baseline check_crossover applied to every prefix, excluding the live tail
+    mean = lambda a: sum(a) / len(a)
+    found = []
+    for n in range(max(fast, slow) + 2, len(closes)):
+        c = closes[:n]
+        fast_now, slow_now = mean(c[-fast:]), mean(c[-slow:])
+        fast_prev, slow_prev = mean(c[-fast - 1:-1]), mean(c[-slow - 1:-1])
+        if fast_prev < slow_prev and fast_now > slow_now:
+            found.append(("Bullish", n - 1))
+        elif fast_prev > slow_prev and fast_now < slow_now:
+            found.append(("Bearish", n - 1))
+    return found
+
+
+def exact_crossovers(cents, fast, slow):
+    # Same as reference_crossovers, in integer cents so ties are exact
+    found = []
+    for n in range(max(fast, slow) + 2, len(cents)):
+        c = cents[:n]
+        d_now = sum(c[-fast:]) * slow - sum(c[-slow:]) * fast
+        d_prev = sum(c[-fast - 1:-1]) * slow - sum(c[-slow - 1:-1]) * fast
+        if d_prev < 0 < d_now:
+            found.append(("Bullish", n - 1))
+        elif d_prev > 0 > d_now:
+            found.append(("Bearish", n - 1))
+    return found
+
+
+def summary(expected):
+    bullish = sum(kind == "Bullish" for kind, _ in expected)
+    bearish = len(expected) - bullish
+    last_kind, last = expected[-1]
+    return (f"[X 1m] History: {bullish} bullish, {bearish} bearish MA crossovers. "
+            f"Last: {last_kind} at 1970-01-01 {last // 60:02d}:{last % 60:02d} UTC")
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    messages = []
+    monkeypatch.setattr(main, "send_telegram", messages.append)
+    monkeypatch.setattr(main, "log_event", lambda text: None)
+    return messages
+
+
+@pytest.mark.parametrize("fast, slow", [(3, 7), (5, 20), (7, 3), (22, 20)])
+def test_backfill_matches_baseline(sent, fast, slow):
+    random.seed(fast * 100 + slow)
+    closes = [100 + random.gauss(0, 1) for _ in range(300)]
+    epochs = [i * 60 for i in range(len(closes))]
+    expected = reference_crossovers(closes, fast, slow)
+
+    m = main.Monitor("X", fast, slow, 60)
+    m._backfill_crossovers(main.np.array(closes), epochs)
+
+    assert expected
+    assert sent == [summary(expected)]
+
+
+@pytest.mark.parametrize("fast, slow", [(1, 2), (3, 7), (5, 20)])
+def test_backfill_treats_cent_price_ties_as_no_crossover(sent, fast, slow):
+    # A cent-quantized random walk ties often; the float MAs must not flip on them
+    random.seed(fast * 100 + slow)
+    cents = [10154]
+    for _ in range(999):
+        cents.append(cents[-1] + random.choice((-1, 0, 1)))
+    closes = [c / 100 for c in cents]
+    epochs = [i * 60 for i in range(len(closes))]
+    expected = exact_crossovers(cents, fast, slow)
+
+    m = main.Monitor("X", fast, slow, 60)
+    m._backfill_crossovers(main.np.array(closes), epochs)
+
+    assert expected
+    assert sent == [summary(expected)]
+
+
+def test_backfill_ignores_short_history_and_empty_windows(sent):
+    closes = main.np.arange(10, dtype=main.np.float64)
+    main.Monitor("X", 5, 20, 60)._backfill_crossovers(closes, list(range(10)))
+    main.Monitor("X", 0, 3, 60)._backfill_crossovers(closes, list(range(10)))
+    assert sent == []
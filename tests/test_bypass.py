@@ -0,0 +1,75 @@
+import orjson
+
+import main
+
+
+def payload(monitor, candles):
+    return orjson.dumps({
+        "candles": [{"close": c, "epoch": e} for e, c in candles],
+        "req_id": monitor.req_id,
+        "subscription": {"id": "sub"},
+    }).decode()
+
+
+def test_latest_candle_single_candle_only():
+    assert main.latest_candle('{"candles":[{"close":1.5,"epoch":60}]}') == (60, 1.5)
+    assert main.latest_candle('{"candles":[{"close":1.5,"epoch":60},{"close":2.5,"epoch":120}]}') is None
+    assert main.latest_candle('{"error":{"code":"x"}}') is None
+
+
+def test_multi_candle_payload_keeps_final_close_of_previous_candle(monkeypatch):
+    monkeypatch.setattr(main, "send_telegram", lambda text: None)
+    monkeypatch.setattr(main, "log_event", lambda text: None)
+    m = main.Monitor("X", 2, 4, 60)
+    m.idx = main.table.alloc(m.window)
+
+    m.on_message(payload(m, [(i * 60, 100.0 + i) for i in range(10)]))
+    # Final close of candle 9 arrives together with the new candle 10
+    m.on_message(payload(m, [(540, 200.0), (600, 300.0)]))
+
+    assert m.last_epoch == 600
+    assert main.table.fast_sum[m.idx] == 200.0 + 300.0
+    assert main.table.slow_sum[m.idx] == 107.0 + 108.0 + 200.0 + 300.0
+    main.table.release(m.idx)
+
+
+def replay(monkeypatch, bypass, messages):
+    alerts = []
+    monkeypatch.setattr(main, "bypass_parsing", bypass)
+    monkeypatch.setattr(main, "send_telegram", alerts.append)
+    monkeypatch.setattr(main, "log_event", lambda text: None)
+    m = main.Monitor("X", 2, 5, 60)
+    m.idx = main.table.alloc(m.window)
+    for build in messages:
+        m.on_message(build(m))
+    state = (
+        m.last_epoch,
+        main.table.fast_sum[m.idx],
+        main.table.slow_sum[m.idx],
+        main.table.closes_ring[m.idx, :m.window].tolist(),
+    )
+    main.table.release(m.idx)
+    return state, alerts
+
+
+def test_bypass_flag_does_not_change_state_or_alerts(monkeypatch):
+    rows = [(e * 60, 100.0 + (e % 7)) for e in range(20)]
+    messages = [lambda m: payload(m, rows)]
+    close = 100.0
+    for e in range(20, 60):
+        for tick in range(3):
+            close += (-1) ** (e + tick) * (0.5 + tick)
+            messages.append(lambda m, e=e, c=close: payload(m, [(e * 60, c)]))
+        # Streamed ohlc updates and errors are not read by either path
+        messages.append(lambda m, e=e: orjson.dumps({
+            "ohlc": {"close": "50.0", "epoch": e * 60 + 1, "open_time": e * 60},
+            "req_id": m.req_id, "subscription": {"id": "sub"},
+        }).decode())
+        messages.append(lambda m: orjson.dumps({"error": {"code": "x"}, "req_id": m.req_id}).decode())
+    # Final close of one candle arriving together with the next
+    messages.append(lambda m: payload(m, [(59 * 60, 120.0), (60 * 60, 80.0)]))
+
+    with_bypass = replay(monkeypatch, True, messages)
+    without_bypass = replay(monkeypatch, False, messages)
+    assert with_bypass == without_bypass
+    assert with_bypass[1]
@@ -0,0 +1,61 @@
+import orjson
+
+import main
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, payload):
+        self.sent.append(orjson.loads(payload))
+
+
+def run_pending(hub):
+    # Let the send tasks scheduled by the hub run
+    hub.loop.run_until_complete(main.asyncio.sleep(0))
+
+
+def ack(monitor, subscription_id):
+    return orjson.dumps({
+        "candles": [{"close": 1.0, "epoch": 60}],
+        "req_id": monitor.req_id,
+        "subscription": {"id": subscription_id},
+    }).decode()
+
+
+def test_remove_before_ack_forgets_when_ack_arrives():
+    hub = main.WSHub("ws://unused")
+    hub.ws = FakeSocket()
+    m = main.Monitor("X", 2, 5, 60)
+    hub._add(m)
+    run_pending(hub)
+    hub._remove(m)
+    run_pending(hub)
+    assert hub.ws.sent == [orjson.loads(m.subscribe_payload)]
+
+    hub.on_message(ack(m, "late-sub"))
+    run_pending(hub)
+    assert hub.ws.sent[-1] == {"forget": "late-sub"}
+    assert hub.pending_forget == set()
+
+    # Further stream messages for the forgotten req_id are ignored
+    hub.on_message(ack(m, "late-sub"))
+    run_pending(hub)
+    assert len(hub.ws.sent) == 2
+    hub.loop.close()
+
+
+def test_remove_after_ack_forgets_immediately(monkeypatch):
+    monkeypatch.setattr(main, "send_telegram", lambda text: None)
+    monkeypatch.setattr(main, "log_event", lambda text: None)
+    hub = main.WSHub("ws://unused")
+    hub.ws = FakeSocket()
+    m = main.Monitor("X", 2, 5, 60)
+    hub._add(m)
+    hub.on_message(ack(m, "sub-1"))
+    hub._remove(m)
+    run_pending(hub)
+    assert hub.ws.sent[-1] == {"forget": "sub-1"}
+    assert hub.pending_forget == set()
+    hub.loop.close()
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+import main
+
+
+def baseline_direction(closes, fast, slow):
+    # Baseline check_crossover on the full close list, gated on the longer window
+    if len(closes) < max(fast, slow) + 2:
+        return 0
+    mean = lambda a: sum(a) / len(a)
+    fast_now, slow_now = mean(closes[-fast:]), mean(closes[-slow:])
+    fast_prev, slow_prev = mean(closes[-fast - 1:-1]), mean(closes[-slow - 1:-1])
+    if fast_prev < slow_prev and fast_now > slow_now:
+        return 1
+    if fast_prev > slow_prev and fast_now < slow_now:
+        return -1
+    return 0
+
+
+@pytest.mark.parametrize("fast, slow", [(3, 7), (1, 2), (7, 3), (22, 20), (5, 5)])
+def test_kernel_matches_baseline(fast, slow):
+    random.seed(fast * 100 + slow)
+    m = main.Monitor("X", fast, slow, 60)
+    idx = main.table.alloc(m.window)
+    closes = []
+    crossovers = 0
+    for _ in range(2000):
+        close = 100 + random.gauss(0, 1)
+        replace = bool(closes) and random.random() < 0.5
+        if replace:
+            closes[-1] = close
+        else:
+            closes.append(close)
+        got = main.table.update(m._check, idx, close, replace)
+        assert got == baseline_direction(closes, fast, slow)
+        crossovers += got != 0
+    main.table.release(idx)
+    assert crossovers or fast == slow
@@ -0,0 +1,39 @@
+import queue
+
+import pytest
+
+import main
+
+
+class FailingLog:
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def flush(self):
+        raise OSError(28, "No space left on device")
+
+
+@pytest.fixture
+def outbox(monkeypatch):
+    posts = []
+    monkeypatch.setattr(main, "_LOG_FH", FailingLog())
+    monkeypatch.setattr(main, "post_telegram", posts.append)
+    monkeypatch.setattr(main, "BATCH_WINDOW", 0.01)
+    yield posts
+    # Leave nothing queued for a real sender
+    while True:
+        try:
+            main.OUTPUT_Q.get_nowait()
+        except queue.Empty:
+            break
+
+
+def test_log_failure_does_not_stop_telegram_sends(outbox):
+    main.log_event("first")
+    main.send_telegram("alert 1")
+    main.drain_output(0.0)  # Flush is due and fails too
+    main.log_event("second")
+    main.send_telegram("alert 2")
+    main.drain_output(0.0)
+
+    assert outbox == ["alert 1", "alert 2"]
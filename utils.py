@@ -0,0 +1,91 @@
+import functools
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Without numba the kernels run as plain Python over numpy
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+# === Rolling mean via cumulative sums ===
+# O(N) for any window size: each mean is a difference of two prefix sums.
+def rolling_mean_cumsum(a, w):
+    c = np.cumsum(np.insert(a, 0, 0.0))
+    return (c[w:] - c[:-w]) / w
+
+# === Per-tick update and crossover check, specialized per window pair ===
+# make_checker(fast, slow) returns check(idx, new_close, replace, closes_ring,
+# head, count, fast_sum, slow_sum), which pushes new_close into row idx's
+# circular buffer (or overwrites the newest close when replace is set) and
+# returns 1 / -1 / 0 for a bullish / bearish / no crossover on the newest
+# close. The arrays are MonitorTable's columns. fast and slow are closed over,
+# so numba compiles them in as constants; one checker is built per pair.
+TIE_EPS = 1e-9  # Relative tolerance below which the two MAs are treated as equal
+
+@functools.lru_cache(maxsize=None)
+def make_checker(fast, slow):
+    # The ring holds the longer window plus the two closes the prev-step sums need
+    longest = max(fast, slow)
+    window = longest + 2
+
+    @njit(nogil=True)
+    def check(idx, new_close, replace, closes_ring, head, count, fast_sum, slow_sum):
+        ring = closes_ring[idx]
+        h = head[idx]
+
+        if replace:
+            # Still-forming candle: its close moved
+            last = (h - 1) % window
+            delta = new_close - ring[last]
+            ring[last] = new_close
+            fast_sum[idx] += delta
+            slow_sum[idx] += delta
+        else:
+            ring[h] = new_close
+            n = min(count[idx] + 1, window)
+            count[idx] = n
+            # Re-sum from the ring once per candle, so rounding from the
+            # per-tick deltas above can't build up across candles
+            fs = 0.0
+            ss = 0.0
+            for k in range(min(n, longest)):
+                c = ring[(h - k) % window]
+                if k < slow:
+                    ss += c
+                if k < fast:
+                    fs += c
+            fast_sum[idx] = fs
+            slow_sum[idx] = ss
+            h = (h + 1) % window
+            head[idx] = h
+
+        if count[idx] < window:
+            return 0
+
+        # Sums one candle back: drop the newest close, re-add the one before the window
+        newest_pos = h - 1
+        newest = ring[newest_pos % window]
+        fast_prev_sum = fast_sum[idx] - newest + ring[(newest_pos - fast) % window]
+        slow_prev_sum = slow_sum[idx] - newest + ring[(newest_pos - slow) % window]
+
+        # Sign of fast MA - slow MA, cross-multiplied by the windows instead of
+        # dividing into means. A crossover is a strict sign flip, so the common
+        # no-crossover case is one multiply and one compare. Differences within
+        # rounding noise of the sums count as equal MAs, i.e. no crossover.
+        d_now = fast_sum[idx] * slow - slow_sum[idx] * fast
+        d_prev = fast_prev_sum * slow - slow_prev_sum * fast
+        tol = TIE_EPS * (abs(fast_sum[idx] * slow) + abs(slow_sum[idx] * fast))
+        if abs(d_now) <= tol or abs(d_prev) <= tol:
+            return 0
+        if d_prev * d_now < 0:
+            return 1 if d_now > 0 else -1
+        return 0
+
+    # Compile now so the first real tick isn't penalized
+    ring = np.zeros((1, window), dtype=np.float64)
+    for replace in (False, True):
+        check(0, 1.0, replace, ring, np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+              np.zeros(1, dtype=np.float64), np.zeros(1, dtype=np.float64))
+    return check